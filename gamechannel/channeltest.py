@@ -9,9 +9,11 @@ on regtest and a GSP.
 
 from . import rpcbroadcast
 
+from xayagametest import retry
 from xayagametest.testcase import XayaGameTest
 
-from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, ExitStack
 import jsonrpclib
 import logging
 import os
@@ -49,7 +51,7 @@ class Daemon ():
 
     self.proc = None
 
-  def start (self, env, **kwargs):
+  def start (self, env, wait=True, **kwargs):
     if self.proc is not None:
       self.log.error ("Channel process is already running, not starting again")
       return
@@ -69,14 +71,18 @@ class Daemon ():
     self.rpc = self.createRpc ()
     self.env = env
 
+    if wait:
+      self.waitForRpc ()
+
+  def waitForRpc (self):
+    """
+    Waits for the JSON-RPC server of the running channel daemon to be up.
+    This is done automatically by start, unless it is called with wait=False.
+    """
+
     self.log.info ("Waiting for the JSON-RPC server to be up...")
-    while True:
-      try:
-        data = self.rpc.getcurrentstate ()
-        self.log.info ("Channel daemon is up for %s" % self.playerName)
-        break
-      except:
-        time.sleep (0.1)
+    retry.withBackoff (self.rpc.getcurrentstate)
+    self.log.info ("Channel daemon is up for %s" % self.playerName)
 
   def stop (self):
     if self.proc is None:
@@ -166,18 +172,56 @@ class TestCase (XayaGameTest):
     underlying Daemon instance when entered.
     """
 
-    daemon = Daemon (playerName, self.basedir, next (self.ports),
-                     self.args.channel_daemon)
+    with self.runChannelDaemons ([(playerName, kwargs)]) as [daemon]:
+      yield daemon
 
-    daemon.start (self.env, playername=playerName,
-                  gsp_rpc_url=self.gamenode.rpcurl,
-                  broadcast_rpc_url=self.bcurl,
-                  **kwargs)
+  @contextmanager
+  def runChannelDaemons (self, players):
+    """
+    Starts multiple channel daemons like runChannelDaemon.  players should
+    be a list of pairs of player name and extra arguments (as dict) for
+    each daemon.  All processes are spawned first, and only then we wait
+    for them to be up, so that they start up in parallel.
 
-    try:
-      yield daemon
-    finally:
-      daemon.stop ()
+    This returns a context manager instance, which returns a list of
+    the underlying Daemon instances (in the order of players) when entered.
+    """
+
+    with ExitStack () as stack:
+      daemons = []
+      for playerName, kwargs in players:
+        daemon = Daemon (playerName, self.basedir, next (self.ports),
+                         self.args.channel_daemon)
+        daemon.start (self.env, wait=False, playername=playerName,
+                      gsp_rpc_url=self.gamenode.rpcurl,
+                      broadcast_rpc_url=self.bcurl,
+                      **kwargs)
+        # Make sure each spawned daemon gets stopped, even if stopping
+        # another one fails.
+        stack.callback (daemon.stop)
+        daemons.append (daemon)
+
+      for d in daemons:
+        d.waitForRpc ()
+
+      yield daemons
+
+  def notifyDaemons (self, daemons, method, *args, **kwargs):
+    """
+    Sends the same RPC notification (e.g. setposition) to all of the
+    given channel daemons.  The calls are done in parallel from separate
+    threads (each daemon has its own RPC connection), so that this takes
+    only as long as the slowest of them rather than the sum.
+    """
+
+    if not daemons:
+      return
+
+    def notify (d):
+      getattr (d.rpc._notify, method) (*args, **kwargs)
+
+    with ThreadPoolExecutor (len (daemons)) as executor:
+      list (executor.map (notify, daemons))
 
   def newSigningAddress (self):
     """
@@ -199,8 +243,7 @@ class TestCase (XayaGameTest):
     values of those fields are.
     """
 
-    ok = False
-    while not ok:
+    while True:
       ok = True
 
       state = None
@@ -225,11 +268,12 @@ class TestCase (XayaGameTest):
           ok = False
           break
 
+      if ok:
+        return state
+
       self.log.warning ("Channel states differ, waiting...")
       time.sleep (0.01)
 
-    return state
-
   @contextmanager
   def waitForTurnIncrease (self, daemons, delta):
     """
@@ -4,13 +4,15 @@
 
 from mover import MoverTest
 
+import re
+
 """
 Tests moverd with persistent storage (and in particular, that the data is
 really persisted and not synced again on a restart).
 """
 
 # Regexp for the log that is printed when we sync from scratch.
-SYNCING_FROM_SCRATCH = 'stored initial game state'
+SYNCING_FROM_SCRATCH = re.compile (r"stored initial game state")
 
 
 class PersistenceTest (MoverTest):
@@ -22,7 +24,9 @@ class PersistenceTest (MoverTest):
   def run (self):
     self.log.info ("Testing storage type '%s'..." % self.storageType)
 
-    self.generate (101)
+    # We just need some coins to send moves, which we can get from the
+    # premine without having to mine 100 blocks for coinbase maturity.
+    self.collectPremine ()
     self.move ("a", "k", 2)
     self.move ("b", "y", 1)
     self.generate (1)
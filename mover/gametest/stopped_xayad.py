@@ -22,6 +22,25 @@ class StoppedXayadTest (MoverTest):
 
     return self.rpc.game.getnullstate ()["state"]
 
+  def waitForState (self, expected, timeout=10):
+    """
+    Waits until the 'state' of the GSP is the expected one.  This polls
+    the GSP regularly, so that we do not have to sleep for the
+    worst-case time it takes to notice a change in the Xaya connection.
+    """
+
+    end = time.time () + timeout
+    while True:
+      state = self.getState ()
+      if state == expected:
+        return
+
+      if time.time () > end:
+        self.assertEqual (state, expected)
+
+      self.log.warning ("GSP state is %s, waiting for %s" % (state, expected))
+      time.sleep (0.1)
+
   def run (self):
     self.generate (101)
     self.expectGameState ({"players": {}})
@@ -56,14 +75,11 @@ class StoppedXayadTest (MoverTest):
     # connection, and automatically reconnect once it is back up.
     self.mainLogger.info ("Stopping Xaya daemon...")
     self.xayanode.stop ()
-    time.sleep (1.5)
-    self.assertEqual (self.getState (), "disconnected")
+    self.waitForState ("disconnected")
 
     self.mainLogger.info ("Starting Xaya daemon...")
     self.xayanode.start ()
-    self.rpc.xaya = self.xayanode.rpc
-    time.sleep (1.5)
-    self.assertEqual (self.getState (), "up-to-date")
+    self.waitForState ("up-to-date")
 
     # Mine another block and verify that the game updates.
     self.generate (1)
@@ -9,8 +9,6 @@ Tests the --xaya_rpc_wait feature of mover (and thus the default main).
 
 from mover import MoverTest
 
-import time
-
 
 class XayaRpcWaitTest (MoverTest):
 
@@ -27,8 +25,7 @@ class XayaRpcWaitTest (MoverTest):
 
     self.mainLogger.info ("Starting Xaya Core as well to sync up...")
     self.xayanode.start ()
-    self.rpc.xaya = self.xayanode.rpc
-    time.sleep (1)
+    self.gamenode.waitForRpc ()
     self.expectGameState ({"players": {
       "a": {"x": 0, "y": 1, "dir": "up", "steps": 1},
     }})
@@ -10,6 +10,20 @@ Tests how a game channel reacts to reorgs of important on-chain transactions
 
 from shipstest import ShipsTest
 
+# Ship position used by all players.  It is written as grid for readability,
+# and collapsed once to the compact string (without whitespace) that we
+# actually send to the channel daemons.
+POSITION = "".join ("""
+  xxxx..xx
+  ........
+  xxx.xxx.
+  ........
+  xx.xx.xx
+  ........
+  ........
+  ........
+""".split ())
+
 
 class ReorgTest (ShipsTest):
 
@@ -44,26 +58,15 @@ class ReorgTest (ShipsTest):
     # a third one, which will join the channel later in a reorged
     # alternate reality.
     self.mainLogger.info ("Starting channel daemons...")
-    with self.runChannelDaemon (channelId, "foo", addr[0]) as foo, \
-         self.runChannelDaemon (channelId, "bar", addr[1]) as bar, \
-         self.runChannelDaemon (channelId, "baz", addr[2]) as baz:
-
-      daemons = [foo, bar, baz]
+    players = [
+      (nm, self.getChannelDaemonArgs (channelId, a))
+      for nm, a in zip (["foo", "bar", "baz"], addr)
+    ]
+    with self.runChannelDaemons (players) as daemons:
+      foo, bar, baz = daemons
 
       self.mainLogger.info ("Running initialisation sequence...")
-      pos = """
-        xxxx..xx
-        ........
-        xxx.xxx.
-        ........
-        xx.xx.xx
-        ........
-        ........
-        ........
-      """
-      foo.rpc._notify.setposition (pos)
-      bar.rpc._notify.setposition (pos)
-      baz.rpc._notify.setposition (pos)
+      self.notifyDaemons (daemons, "setposition", POSITION)
 
       # Play a couple of turns and save the resulting "original" state.
       for c in range (8):
@@ -9,6 +9,29 @@ Tests the validateposition RPC method of ships-channel.
 
 from shipstest import ShipsTest
 
+# Test positions, written as grids for readability and collapsed once
+# to the compact strings (without whitespace) sent to the daemon.
+INVALID_POSITION = "".join ("""
+  xx......
+  xx......
+  ........
+  xxxx..xx
+  ........
+  xxx.xxx.
+  ........
+  xx.xx.xx
+""".split ())
+VALID_POSITION = "".join ("""
+  ........
+  ........
+  ........
+  xxxx..xx
+  ........
+  xxx.xxx.
+  ........
+  xx.xx.xx
+""".split ())
+
 
 class ValidatePositionTest (ShipsTest):
 
@@ -22,26 +45,8 @@ class ValidatePositionTest (ShipsTest):
     with self.runChannelDaemon (channelId, "foo", addr) as ch:
       self.mainLogger.info ("Testing validateposition...")
       self.assertEqual (False, ch.rpc.validateposition ("invalid string"))
-      self.assertEqual (False, ch.rpc.validateposition ("""
-        xx......
-        xx......
-        ........
-        xxxx..xx
-        ........
-        xxx.xxx.
-        ........
-        xx.xx.xx
-      """))
-      self.assertEqual (True, ch.rpc.validateposition ("""
-        ........
-        ........
-        ........
-        xxxx..xx
-        ........
-        xxx.xxx.
-        ........
-        xx.xx.xx
-      """))
+      self.assertEqual (False, ch.rpc.validateposition (INVALID_POSITION))
+      self.assertEqual (True, ch.rpc.validateposition (VALID_POSITION))
 
 
 if __name__ == "__main__":
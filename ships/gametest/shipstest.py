@@ -81,9 +81,19 @@ class ShipsTest (channeltest.TestCase):
     """
 
     return super ().runChannelDaemon (playerName,
-        channelid=channelId,
-        address=address,
-        xaya_rpc_url=self.xayanode.rpcurl)
+        **self.getChannelDaemonArgs (channelId, address))
+
+  def getChannelDaemonArgs (self, channelId, address):
+    """
+    Returns the extra arguments for the ships-channel binary (as dict),
+    e.g. for use with runChannelDaemons.
+    """
+
+    return {
+      "channelid": channelId,
+      "address": address,
+      "xaya_rpc_url": self.xayanode.rpcurl,
+    }
 
   def getStateProof (self, cid, stateStr):
     """
@@ -6,6 +6,8 @@
 Code for running a game daemon as component in an integration test.
 """
 
+from . import retry
+
 import jsonrpclib
 import logging
 import os
@@ -13,7 +15,6 @@ import os.path
 import re
 import shutil
 import subprocess
-import time
 
 
 class Node ():
@@ -78,14 +79,17 @@ class Node ():
     self.rpc = self.createRpc ()
 
     if wait:
-      self.log.info ("Waiting for the JSON-RPC server to be up...")
-      while True:
-        try:
-          data = self.rpc.getcurrentstate ()
-          self.log.info ("Game daemon is up, chain = %s" % data["chain"])
-          break
-        except:
-          time.sleep (1)
+      self.waitForRpc ()
+
+  def waitForRpc (self):
+    """
+    Waits for the JSON-RPC server of the running game daemon to be up.
+    This is done automatically by start, unless it is called with wait=False.
+    """
+
+    self.log.info ("Waiting for the JSON-RPC server to be up...")
+    data = retry.withBackoff (self.rpc.getcurrentstate)
+    self.log.info ("Game daemon is up, chain = %s" % data["chain"])
 
   def stop (self):
     if self.proc is None:
@@ -110,7 +114,7 @@ class Node ():
   def logMatches (self, expr, times=None):
     """
     Checks if a line of the current INFO log for the game daemon matches
-    the given regexp (as string).
+    the given regexp (as string or precompiled pattern).
     """
 
     # If the daemon is currently running, some log lines may be cached and
@@ -123,14 +127,18 @@ class Node ():
                             os.path.basename (self.realBinary) + ".INFO")
 
     count = 0
-    for line in open (logfile, 'r'):
-      if obj.search (line):
-        count += 1
+    with open (logfile, 'r') as f:
+      for line in f:
+        if obj.search (line):
+          count += 1
+          # If we just need any match, there is no need to read further.
+          if times is None:
+            return True
 
     if times is not None:
       if count != times:
         self.log.error ("Expected %d matches in log, got %d: %s"
-                          % (times, count, expr))
+                          % (times, count, obj.pattern))
         return False
       return True
 
@@ -0,0 +1,33 @@
+# Copyright (C) 2026 The Xaya developers
+# Distributed under the MIT software license, see the accompanying
+# file COPYING or http://www.opensource.org/licenses/mit-license.php.
+
+"""
+Utility code for retrying an operation (like an RPC call to a daemon that
+is still starting up) until it succeeds.
+"""
+
+import time
+
+
+def withBackoff (fcn, timeout=60, initialDelay=0.005, maxDelay=0.2):
+  """
+  Calls fcn repeatedly until it succeeds (i.e. does not raise) and returns
+  its result.  After each failure, we sleep before trying again; the delay
+  starts at initialDelay and is doubled each time, up to maxDelay.  That way
+  we notice quickly if e.g. a daemon comes up fast, while not spinning
+  too much if it takes longer.
+
+  If fcn still fails after timeout seconds, the last exception is re-raised.
+  """
+
+  delay = initialDelay
+  end = time.monotonic () + timeout
+  while True:
+    try:
+      return fcn ()
+    except Exception:
+      if time.monotonic () > end:
+        raise
+      time.sleep (delay)
+      delay = min (2 * delay, maxDelay)
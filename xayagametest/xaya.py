@@ -6,6 +6,8 @@
 Code for running the Xaya Core daemon as component in an integration test.
 """
 
+from . import retry
+
 from contextlib import contextmanager
 import jsonrpclib
 import logging
@@ -13,7 +15,6 @@ import os
 import os.path
 import shutil
 import subprocess
-import time
 
 
 class Node:
@@ -44,13 +45,23 @@ class Node:
                     % self.datadir)
     shutil.rmtree (self.datadir, ignore_errors=True)
     os.mkdir (self.datadir)
+    lines = ["[regtest]"]
+    lines.extend (["%s=%s" % (key, value)
+                   for key, value in self.config.items ()])
     with open (os.path.join (self.datadir, "xaya.conf"), "wt") as f:
-      f.write ("[regtest]\n")
-      for key, value in self.config.items ():
-        f.write ("%s=%s\n" % (key, value))
+      f.write ("\n".join (lines) + "\n")
 
     self.proc = None
 
+    # RPC handles created for the wallets, keyed by their URL.  They are
+    # reused for repeated requests of the same wallet and also across
+    # restarts of the node (jsonrpclib reconnects them as needed).
+    self.rpcHandles = {}
+
+    # Set once we have created the default wallet in the (fresh) datadir.
+    # Xaya Core loads it automatically on later restarts.
+    self.walletCreated = False
+
   def start (self):
     if self.proc is not None:
       self.log.error ("Xaya process is already running, not starting again")
@@ -69,26 +80,25 @@ class Node:
     rpc = jsonrpclib.ServerProxy (self.baseRpcUrl)
 
     self.log.info ("Waiting for the JSON-RPC server to be up...")
-    while True:
-      try:
-        data = rpc.getnetworkinfo ()
-        self.log.info ("Daemon %s is up" % data["subversion"])
-        break
-      except:
-        time.sleep (0.1)
+    data = retry.withBackoff (rpc.getnetworkinfo)
+    self.log.info ("Daemon %s is up" % data["subversion"])
 
     # Make sure we have a default wallet.  We use a legacy wallet
-    # so we can importprivkey the premine.
-    wallets = rpc.listwallets ()
-    if "" not in wallets:
+    # so we can importprivkey the premine.  The datadir is created fresh
+    # together with this instance, so we know whether or not the wallet
+    # exists already without asking Xaya Core for it.
+    if not self.walletCreated:
       self.log.info ("Creating default wallet in Xaya Core...")
       rpc.createwallet (wallet_name="", descriptors=False)
+      self.walletCreated = True
 
     # We need to explicitly close the client connection, or else
     # Xaya Core will wait for it when shutting down.
     rpc ("close") ()
 
-    self.rpcHandles = []
+    # Since the handles are cached, this is the same instance across
+    # restarts of the node.  Tests can thus keep references to self.rpc
+    # (e.g. as rpc.xaya) even if they stop and start the node.
     self.rpcurl, self.rpc = self.getWalletRpc ("")
 
   def stop (self):
@@ -99,9 +109,8 @@ class Node:
     self.log.info ("Stopping Xaya process")
     self.rpc.stop ()
 
-    for h in self.rpcHandles:
+    for h in self.rpcHandles.values ():
       h ("close") ()
-    self.rpcHandles = []
 
     self.log.info ("Waiting for Xaya process to stop...")
     self.proc.wait ()
@@ -122,17 +131,18 @@ class Node:
   def getWalletRpc (self, wallet):
     """
     Returns the RPC URL to use for a particular wallet as well as
-    a ServerProxy instance.
+    a ServerProxy instance.  The instance is shared between all callers
+    asking for the same wallet, so that its HTTP connection is kept alive
+    and reused rather than a new one being opened each time.
     """
 
     url = "%s/wallet/%s" % (self.baseRpcUrl, wallet)
-    rpc = jsonrpclib.ServerProxy (url)
-
-    # Record all RPC handles created, so we can close them when
-    # shutting down.
-    self.rpcHandles.append (rpc)
+    if url not in self.rpcHandles:
+      # Record all RPC handles created, so we can reuse them and close
+      # them when shutting down.
+      self.rpcHandles[url] = jsonrpclib.ServerProxy (url)
 
-    return url, rpc
+    return url, self.rpcHandles[url]
 
 
 class Environment:
@@ -158,6 +168,10 @@ class Environment:
       yield self
 
   def generate (self, num):
+    # We use a fresh address each time on purpose, instead of caching one.
+    # That way the coinbase (and thus the block) differs when we mine again
+    # at a height whose block has been invalidated.  Otherwise Core could
+    # rebuild exactly the invalidated block and reject it.
     addr = self.node.rpc.getnewaddress ()
     return self.node.rpc.generatetoaddress (num, addr)
 
@@ -178,6 +192,13 @@ class Environment:
     return self.node.rpc.signmessage (addr, msg)
 
   def getChainTip (self):
+    """
+    Returns the current best block hash and height.  This is deliberately
+    queried through a single getblockchaininfo call each time:  It returns
+    both values atomically, and tests change the tip also directly through
+    RPC (e.g. invalidateblock), so that a cached value could be stale.
+    """
+
     info = self.node.rpc.getblockchaininfo ()
     return info["bestblockhash"], info["blocks"]
 